@@ -67,7 +67,7 @@ fi
 find_active_tasks() {
   find tasks -maxdepth 2 -name "prd.json" -type f 2>/dev/null | \
     grep -v "tasks/archived/" | \
-    xargs -I {} dirname {} | \
+    sed 's|/prd\.json$||' | \
     sort
 }
 
@@ -75,11 +75,14 @@ find_active_tasks() {
 display_task_info() {
   local task_dir="$1"
   local prd_file="$task_dir/prd.json"
-  local description=$(jq -r '.description // "No description"' "$prd_file" 2>/dev/null | head -c 60)
-  local total=$(jq '.userStories | length' "$prd_file" 2>/dev/null || echo "?")
-  local done=$(jq '[.userStories[] | select(.passes == true)] | length' "$prd_file" 2>/dev/null || echo "?")
-  local type=$(jq -r '.type // "feature"' "$prd_file" 2>/dev/null)
-  printf "%-35s [%s/%s] %s\n" "$task_dir" "$done" "$total" "($type)"
+  local done total type
+  # Single jq call for both story counts and the type
+  # (|| true: an unreadable prd.json must not end the picker under set -e)
+  read -r done total type < <(
+    jq -r '[([(.userStories // [])[] | select(.passes == true)] | length),
+            ((.userStories // []) | length), (.type // "feature")] | map(tostring) | join(" ")' "$prd_file" 2>/dev/null
+  ) || true
+  printf "%-35s [%s/%s] %s\n" "$task_dir" "${done:-?}" "${total:-?}" "(${type:-feature})"
 }
 
 # If no task directory provided, find and prompt
@@ -156,6 +159,9 @@ PRD_FILE="$FULL_TASK_DIR/prd.json"
 PROGRESS_FILE="$FULL_TASK_DIR/progress.txt"
 PROMPT_FILE="$SCRIPT_DIR/prompt.md"
 
+# Completed-story count, shared by the banner and every later refresh so they always agree
+COMPLETED_FILTER='[(.userStories // [])[] | select(.passes == true)] | length'
+
 # Validate task directory exists
 if [ ! -d "$FULL_TASK_DIR" ]; then
   echo "Error: Task directory not found: $TASK_DIR"
@@ -171,13 +177,18 @@ fi
 
 # Initialize progress file if it doesn't exist
 if [ ! -f "$PROGRESS_FILE" ]; then
-  EFFORT_NAME=$(basename "$TASK_DIR")
+  # Strip every trailing slash (like basename) before taking the last path component
+  EFFORT_NAME="$TASK_DIR"
+  while [[ "$EFFORT_NAME" == */ ]]; do EFFORT_NAME="${EFFORT_NAME%/}"; done
+  EFFORT_NAME="${EFFORT_NAME##*/}"
   PRD_TYPE=$(jq -r '.type // "feature"' "$PRD_FILE" 2>/dev/null || echo "feature")
-  echo "# Ralph Progress Log" > "$PROGRESS_FILE"
-  echo "Effort: $EFFORT_NAME" >> "$PROGRESS_FILE"
-  echo "Type: $PRD_TYPE" >> "$PROGRESS_FILE"
-  echo "Started: $(date)" >> "$PROGRESS_FILE"
-  echo "---" >> "$PROGRESS_FILE"
+  {
+    echo "# Ralph Progress Log"
+    echo "Effort: $EFFORT_NAME"
+    echo "Type: $PRD_TYPE"
+    echo "Started: $(date)"
+    echo "---"
+  } > "$PROGRESS_FILE"
 fi
 
 # Function to rotate progress file if needed
@@ -214,19 +225,20 @@ rotate_progress_if_needed() {
     # Move current to progress-N.txt
     mv "$PROGRESS_FILE" "$TASK_DIR/progress-$n.txt"
 
-    # Extract codebase patterns section
-    local patterns_section=""
-    if grep -q "## Codebase Patterns" "$TASK_DIR/progress-$n.txt"; then
-      patterns_section=$(sed -n '/## Codebase Patterns/,/^## [^C]/p' "$TASK_DIR/progress-$n.txt" | sed '$d')
-    fi
-
-    # Get effort info from rotated file
-    local effort_name=$(grep "^Effort:" "$TASK_DIR/progress-$n.txt" | head -1)
-    local effort_type=$(grep "^Type:" "$TASK_DIR/progress-$n.txt" | head -1)
-    local started=$(grep "^Started:" "$TASK_DIR/progress-$n.txt" | head -1)
-
-    # Count stories completed in rotated file
-    local story_count=$(grep -c "^## .* - S[0-9]" "$TASK_DIR/progress-$n.txt" 2>/dev/null || echo "0")
+    # Extract codebase patterns section (empty when the file has none)
+    local patterns_section
+    patterns_section=$(sed -n '/## Codebase Patterns/,/^## [^C]/p' "$TASK_DIR/progress-$n.txt" | sed '$d')
+
+    # Get effort info and count stories completed in one pass over the rotated file
+    local effort_name effort_type started story_count
+    IFS=$'\x1f' read -r effort_name effort_type started story_count < <(
+      awk '/^Effort:/ && e == "" { e = $0 }
+           /^Type:/ && t == "" { t = $0 }
+           /^Started:/ && s == "" { s = $0 }
+           /^## .* - S[0-9]/ { c++ }
+           END { printf "%s\037%s\037%s\037%d\n", e, t, s, c }' "$TASK_DIR/progress-$n.txt" 2>/dev/null
+    ) || true
+    story_count="${story_count:-0}"
 
     # Build reference chain
     local prior_ref=""
@@ -256,11 +268,19 @@ EOF
   fi
 }
 
-# Get info from prd.json for display
-DESCRIPTION=$(jq -r '.description // "No description"' "$PRD_FILE" 2>/dev/null || echo "Unknown")
-BRANCH_NAME=$(jq -r '.branchName // "unknown"' "$PRD_FILE" 2>/dev/null || echo "unknown")
-TOTAL_STORIES=$(jq '.userStories | length' "$PRD_FILE" 2>/dev/null || echo "?")
-COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+# Get info from prd.json for display in one jq pass. Fields are separated by \x1f and the
+# description goes last, so read -d '' keeps any newlines in it; the fallbacks only apply
+# when jq itself fails, as they did for the separate per-field calls.
+if PRD_SUMMARY=$(jq -j '[.branchName // "unknown", (.userStories | length),
+                         ('"$COMPLETED_FILTER"'),
+                         .description // "No description"] | map(tostring) | join("\u001f")' "$PRD_FILE" 2>/dev/null); then
+  IFS=$'\x1f' read -r -d '' BRANCH_NAME TOTAL_STORIES COMPLETED_STORIES DESCRIPTION < <(printf '%s' "$PRD_SUMMARY") || true
+else
+  DESCRIPTION="Unknown"
+  BRANCH_NAME="unknown"
+  TOTAL_STORIES="?"
+  COMPLETED_STORIES="?"
+fi
 
 echo ""
 echo "╔═══════════════════════════════════════════════════════════════╗"
@@ -284,8 +304,10 @@ for i in $(seq 1 $MAX_ITERATIONS); do
   # Check and rotate progress file if needed
   rotate_progress_if_needed
 
-  # Refresh progress count
-  COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+  # Refresh progress count (the banner already read it for the first iteration)
+  if [ $i -gt 1 ]; then
+    COMPLETED_STORIES=$(jq "$COMPLETED_FILTER" "$PRD_FILE" 2>/dev/null || echo "?")
+  fi
 
   echo ""
   echo "═══════════════════════════════════════════════════════════════"
@@ -320,7 +342,8 @@ $(cat "$PROMPT_FILE")
 
   # Show spinner while monitoring tmux session
   SPINNER="⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-  START_TIME=$(date +%s)
+  # Built-in $SECONDS avoids forking date each tick (it follows the wall clock, so it is not monotonic)
+  START_TIME=$SECONDS
   LAST_STATUS="Starting..."
   LAST_MODEL_TEXT=""
   LAST_TOOL=""
@@ -345,13 +368,18 @@ $(cat "$PROMPT_FILE")
     HAS_TTY=true
   fi
 
+  # Terminal width for the redraw loop, refreshed only when the window is resized
+  TERM_WIDTH=$(tput cols 2>/dev/null || echo 80)
+  trap 'TERM_WIDTH=$(tput cols 2>/dev/null || echo 80)' WINCH
+
   while tmux has-session -t "$TMUX_SESSION" 2>/dev/null; do
-    # Check if session completed
-    if grep -q "RALPH_SESSION_DONE" "$OUTPUT_FILE" 2>/dev/null; then
+    # Check if session completed (the marker is appended last, so only scan the tail
+    # instead of re-reading the whole transcript on every tick)
+    if tail -c 64 "$OUTPUT_FILE" 2>/dev/null | grep -q "RALPH_SESSION_DONE"; then
       break
     fi
 
-    ELAPSED=$(($(date +%s) - START_TIME))
+    ELAPSED=$((SECONDS - START_TIME))
     MINS=$((ELAPSED / 60))
     SECS=$((ELAPSED % 60))
 
@@ -487,7 +515,7 @@ $(cat "$PROMPT_FILE")
         else
           LAST_STATUS="→ YOU: $FIRST_LINE"
         fi
-        MSG_SENT_TIME=$(date +%s)
+        MSG_SENT_TIME=$SECONDS
         AWAITING_RESPONSE=true
       else
         LAST_STATUS="(empty - cancelled)"
@@ -501,7 +529,7 @@ $(cat "$PROMPT_FILE")
       CHECKPOINT_MSG="IMPORTANT: Please stop what you're doing and update prd.json and progress.txt with your current progress, any challenges or blockers, and incomplete items. Then continue."
       tmux send-keys -t "$TMUX_SESSION" "$CHECKPOINT_MSG" Enter
       LAST_STATUS="→ CHECKPOINT: Requesting progress save..."
-      MSG_SENT_TIME=$(date +%s)
+      MSG_SENT_TIME=$SECONDS
       AWAITING_RESPONSE=true
     elif [ "$KEY" = "q" ] && [ "$HAS_TTY" = true ]; then  # 'q' to quit entirely
       USER_QUIT=true
@@ -512,8 +540,6 @@ $(cat "$PROMPT_FILE")
     fi
 
     # Update display (5 lines: spinner, model text, status, tool, shortcuts)
-    # Get terminal width, default to 80
-    TERM_WIDTH=$(tput cols 2>/dev/null || echo 80)
     MAX_LEN=$((TERM_WIDTH - 5))  # Leave room for leading spaces and safety
 
     # Truncate text to fit terminal
@@ -521,31 +547,36 @@ $(cat "$PROMPT_FILE")
     DISP_STATUS="${LAST_STATUS:0:$MAX_LEN}"
     DISP_TOOL="${LAST_TOOL:0:$MAX_LEN}"
 
-    printf "\033[5A\r"
-    printf "\033[K  ${SPINNER:0:1} Claude working... %02d:%02d\n" $MINS $SECS
+    # Build the whole frame first and emit it with a single write
+    printf -v FRAME "\033[5A\r\033[K  ${SPINNER:0:1} Claude working... %02d:%02d\n" $MINS $SECS
     # Model text line (Claude's actual output)
     if [ -n "$LAST_MODEL_TEXT" ]; then
-      printf "\033[K  \033[97m%s\033[0m\n" "$DISP_MODEL"  # bright white for model text
+      printf -v LINE "\033[K  \033[97m%s\033[0m\n" "$DISP_MODEL"  # bright white for model text
     else
-      printf "\033[K  \033[90m(waiting for output...)\033[0m\n"
+      printf -v LINE "\033[K  \033[90m(waiting for output...)\033[0m\n"
     fi
+    FRAME+="$LINE"
     # Status line with color based on state
     if [[ "$LAST_STATUS" == "→ YOU:"* ]]; then
-      printf "\033[K  \033[33m%s\033[0m\n" "$DISP_STATUS"  # yellow
+      printf -v LINE "\033[K  \033[33m%s\033[0m\n" "$DISP_STATUS"  # yellow
     elif [[ "$LAST_STATUS" == "→ CHECKPOINT:"* ]]; then
-      printf "\033[K  \033[35m%s\033[0m\n" "$DISP_STATUS"  # magenta
+      printf -v LINE "\033[K  \033[35m%s\033[0m\n" "$DISP_STATUS"  # magenta
     elif [[ "$LAST_STATUS" == "← CLAUDE:"* ]]; then
-      printf "\033[K  \033[32m%s\033[0m\n" "$DISP_STATUS"  # green
+      printf -v LINE "\033[K  \033[32m%s\033[0m\n" "$DISP_STATUS"  # green
     else
-      printf "\033[K  \033[37m%s\033[0m\n" "$DISP_STATUS"  # white
+      printf -v LINE "\033[K  \033[37m%s\033[0m\n" "$DISP_STATUS"  # white
     fi
+    FRAME+="$LINE"
     # Tool line (always show, even if empty)
     if [ -n "$LAST_TOOL" ]; then
-      printf "\033[K  \033[36m%s\033[0m\n" "$DISP_TOOL"  # cyan for tool
+      printf -v LINE "\033[K  \033[36m%s\033[0m\n" "$DISP_TOOL"  # cyan for tool
     else
-      printf "\033[K  \033[90m(no tool)\033[0m\n"
+      printf -v LINE "\033[K  \033[90m(no tool)\033[0m\n"
     fi
-    printf "\033[K  \033[90m[i: message | f: checkpoint | q: quit]\033[0m\n"
+    FRAME+="$LINE"
+    printf -v LINE "\033[K  \033[90m[i: message | f: checkpoint | q: quit]\033[0m\n"
+    FRAME+="$LINE"
+    printf "%s" "$FRAME"
 
     # Rotate spinner
     SPINNER="${SPINNER:1}${SPINNER:0:1}"
@@ -558,12 +589,14 @@ $(cat "$PROMPT_FILE")
     stty "$OLD_STTY"
   fi
 
+  trap - WINCH
+
   # Wait for tmux session to fully close
   tmux kill-session -t "$TMUX_SESSION" 2>/dev/null || true
   rm -f "$PROMPT_FILE_TMP"
 
   # Clear spinner lines and show completion
-  ELAPSED=$(($(date +%s) - START_TIME))
+  ELAPSED=$((SECONDS - START_TIME))
   MINS=$((ELAPSED / 60))
   SECS=$((ELAPSED % 60))
   printf "\033[5A"
@@ -584,7 +617,7 @@ $(cat "$PROMPT_FILE")
     printf "\033[K\n"
     printf "\033[K\n"
     echo ""
-    COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+    COMPLETED_STORIES=$(jq "$COMPLETED_FILTER" "$PRD_FILE" 2>/dev/null || echo "?")
     echo "  Progress: $COMPLETED_STORIES of $TOTAL_STORIES stories complete."
     echo "  Run again with: ./ralph-i.sh $TASK_DIR"
     echo ""
@@ -628,7 +661,7 @@ echo "╔═══════════════════════
 echo "║  Ralph reached max iterations                                 ║"
 echo "╚═══════════════════════════════════════════════════════════════╝"
 echo ""
-COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+COMPLETED_STORIES=$(jq "$COMPLETED_FILTER" "$PRD_FILE" 2>/dev/null || echo "?")
 echo "  Completed $COMPLETED_STORIES of $TOTAL_STORIES stories in $MAX_ITERATIONS iterations."
 echo "  Check $PROGRESS_FILE for status."
 echo "  Run again with more iterations: ./ralph-i.sh $TASK_DIR <more_iterations>"
@@ -6,11 +6,12 @@ use theme::{
     TEXT_SECONDARY,
 };
 
+use std::borrow::Cow;
 use std::io::{self, stdout, Read, Write};
 use std::path::PathBuf;
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
 use std::thread;
-use std::time::{Duration, Instant};
+use std::time::{Duration, Instant, SystemTime};
 
 use crossterm::{
     event::{self, DisableMouseCapture, EnableMouseCapture, Event, KeyCode, KeyEventKind, KeyModifiers, MouseEventKind},
@@ -147,8 +148,8 @@ struct Prd {
 impl Prd {
     /// Load PRD from a JSON file
     fn load(path: &PathBuf) -> io::Result<Self> {
-        let content = std::fs::read_to_string(path)?;
-        serde_json::from_str(&content).map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))
+        let content = std::fs::read(path)?;
+        serde_json::from_slice(&content).map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))
     }
 
     /// Count completed stories
@@ -236,27 +237,27 @@ impl Activity {
     }
 }
 
+/// Activity patterns to look for (case-insensitive matching in output)
+/// Claude Code typically shows tool usage in various formats
+const ACTIVITY_PATTERNS: &[(&str, &[&str])] = &[
+    ("Read", &["reading ", "read file", "read("]),
+    ("Edit", &["editing ", "edit file", "edit("]),
+    ("Write", &["writing ", "write file", "write("]),
+    ("Bash", &["running ", "$ ", "bash(", "executing "]),
+    ("Grep", &["searching ", "grep(", "grep for"]),
+    ("Glob", &["finding files", "glob(", "globbing"]),
+    ("TodoWrite", &["updating todos", "todowrite(", "adding todo"]),
+];
+
 /// Parse activities from Claude output
 /// Looks for tool call patterns in the output
 fn parse_activities(text: &str) -> Vec<Activity> {
     let mut activities = Vec::new();
 
-    // Patterns to look for (case-insensitive matching in output)
-    // Claude Code typically shows tool usage in various formats
-    let patterns: &[(&str, &[&str])] = &[
-        ("Read", &["reading ", "read file", "read("]),
-        ("Edit", &["editing ", "edit file", "edit("]),
-        ("Write", &["writing ", "write file", "write("]),
-        ("Bash", &["running ", "$ ", "bash(", "executing "]),
-        ("Grep", &["searching ", "grep(", "grep for"]),
-        ("Glob", &["finding files", "glob(", "globbing"]),
-        ("TodoWrite", &["updating todos", "todowrite(", "adding todo"]),
-    ];
-
     for line in text.lines() {
         let line_lower = line.to_lowercase();
 
-        for (action_type, prefixes) in patterns {
+        for (action_type, prefixes) in ACTIVITY_PATTERNS {
             for prefix in *prefixes {
                 if let Some(pos) = line_lower.find(prefix) {
                     // Extract target (rest of line after pattern, cleaned up)
@@ -297,12 +298,19 @@ fn parse_activities(text: &str) -> Vec<Activity> {
 /// Maximum number of activities to track
 const MAX_ACTIVITIES: usize = 10;
 
+/// Signal Claude prints when all stories are complete
+const COMPLETION_SIGNAL: &str = "<promise>COMPLETE</promise>";
+
 /// Shared state for PTY with VT100 parser
 struct PtyState {
     parser: vt100::Parser,
     child_exited: bool,
     /// Recent raw output for detecting completion signal
     recent_output: String,
+    /// Trailing bytes of a UTF-8 character split across PTY reads
+    pending_utf8: Vec<u8>,
+    /// Byte offset in recent_output of the latest completion signal (None once trimmed away)
+    completion_pos: Option<usize>,
     /// Recent activities parsed from output
     activities: Vec<Activity>,
     /// Last parsed output position (to avoid re-parsing)
@@ -315,6 +323,8 @@ impl PtyState {
             parser: vt100::Parser::new(rows, cols, 1000), // 1000 lines of scrollback
             child_exited: false,
             recent_output: String::new(),
+            pending_utf8: Vec::new(),
+            completion_pos: None,
             activities: Vec::new(),
             last_activity_parse_pos: 0,
         }
@@ -322,31 +332,53 @@ impl PtyState {
 
     /// Append output and trim to last 10KB to prevent memory issues
     fn append_output(&mut self, data: &[u8]) {
-        if let Ok(s) = std::str::from_utf8(data) {
-            self.recent_output.push_str(s);
-            // Keep only last 10KB to limit memory
-            if self.recent_output.len() > 10 * 1024 {
-                let target_start = self.recent_output.len() - 8 * 1024;
-                // Find a valid UTF-8 character boundary using char_indices
-                // char_indices always returns valid byte boundaries
-                if let Some((start, _)) = self
-                    .recent_output
-                    .char_indices()
-                    .find(|(i, _)| *i >= target_start)
-                {
-                    // Use safe get() to avoid any potential panic
-                    if let Some(trimmed) = self.recent_output.get(start..) {
-                        self.recent_output = trimmed.to_string();
-                    }
-                }
-                // If we can't find a valid boundary, just clear (shouldn't happen)
+        // Prepend the incomplete character left over from the previous read
+        let joined;
+        let bytes: &[u8] = if self.pending_utf8.is_empty() {
+            data
+        } else {
+            let mut buf = std::mem::take(&mut self.pending_utf8);
+            buf.extend_from_slice(data);
+            joined = buf;
+            &joined
+        };
+        let s: Cow<str> = match std::str::from_utf8(bytes) {
+            Ok(s) => Cow::Borrowed(s),
+            // The read ended mid-character: keep the valid prefix, carry the tail over
+            Err(e) if e.error_len().is_none() => {
+                let (valid, tail) = bytes.split_at(e.valid_up_to());
+                self.pending_utf8.extend_from_slice(tail);
+                Cow::Borrowed(std::str::from_utf8(valid).unwrap_or_default())
             }
+            Err(_) => String::from_utf8_lossy(bytes),
+        };
+        // Only scan the new text (plus enough overlap to catch a signal split
+        // across reads) instead of re-searching the whole buffer every frame
+        let mut scan_from = self.recent_output.len().saturating_sub(COMPLETION_SIGNAL.len() - 1);
+        while !self.recent_output.is_char_boundary(scan_from) {
+            scan_from += 1;
+        }
+        self.recent_output.push_str(&s);
+        if let Some(offset) = self.recent_output[scan_from..].rfind(COMPLETION_SIGNAL) {
+            self.completion_pos = Some(scan_from + offset);
+        }
+        // Keep only last 10KB to limit memory
+        if self.recent_output.len() > 10 * 1024 {
+            // Move forward to the next UTF-8 character boundary (at most 3 bytes)
+            let mut start = self.recent_output.len() - 8 * 1024;
+            while !self.recent_output.is_char_boundary(start) {
+                start += 1;
+            }
+            // Drop the prefix in place, reusing the existing allocation
+            self.recent_output.drain(..start);
+            // The latest signal is the only one that matters; forget it once it leaves the window
+            self.completion_pos = self.completion_pos.and_then(|pos| pos.checked_sub(start));
         }
     }
 
-    /// Check if completion signal is present in recent output
+    /// Check if completion signal has been seen in output (tracked by append_output)
     fn has_completion_signal(&self) -> bool {
-        self.recent_output.contains("<promise>COMPLETE</promise>")
+        self.completion_pos.is_some()
     }
 
     /// Check if stop hook fired (iteration complete message in output)
@@ -355,12 +387,14 @@ impl PtyState {
     /// We check for multiple possible patterns since ANSI codes may interfere
     fn has_stop_hook_signal(&self) -> bool {
         // Check raw output first (with ANSI stripping)
-        let stripped = strip_ansi_codes(&self.recent_output);
-        let stripped_lower = stripped.to_lowercase();
+        // The patterns are ASCII, so lowercase the stripped copy in place rather
+        // than allocating a second Unicode-lowercased string every frame
+        let mut stripped_lower = strip_ansi_codes(&self.recent_output);
+        stripped_lower.make_ascii_lowercase();
 
+        // "stop hook" also covers the "ran 1 stop hook" status line
         if stripped_lower.contains("iteration complete")
             || stripped_lower.contains("ralph-tui will start next iteration")
-            || stripped_lower.contains("ran 1 stop hook")
             || stripped_lower.contains("stop hook")
         {
             return true;
@@ -370,8 +404,8 @@ impl PtyState {
         let screen = self.parser.screen();
         let (rows, _cols) = screen.size();
         for row in 0..rows {
-            let row_text = screen.contents_between(row, 0, row, 200);
-            let row_lower = row_text.to_lowercase();
+            let mut row_lower = screen.contents_between(row, 0, row, 200);
+            row_lower.make_ascii_lowercase();
             if row_lower.contains("stop hook") || row_lower.contains("iteration complete") {
                 return true;
             }
@@ -383,6 +417,8 @@ impl PtyState {
     /// Clear recent output (called when starting new iteration)
     fn clear_recent_output(&mut self) {
         self.recent_output.clear();
+        self.pending_utf8.clear();
+        self.completion_pos = None;
         self.activities.clear();
         self.last_activity_parse_pos = 0;
     }
@@ -437,6 +473,32 @@ enum IterationState {
     WaitingDelay,  // Waiting before starting next iteration
 }
 
+/// Modification time and size of a file, used to tell whether it changed on disk (None if unavailable)
+fn file_stamp(path: &PathBuf) -> Option<(SystemTime, u64)> {
+    std::fs::metadata(path)
+        .and_then(|m| Ok((m.modified()?, m.len())))
+        .ok()
+}
+
+/// File contents cached by modification time and size, for views that redraw every frame
+#[derive(Default)]
+struct CachedFile {
+    key: Option<(SystemTime, u64)>,
+    content: Option<String>,
+}
+
+impl CachedFile {
+    /// Return the file contents, re-reading only when the file changed on disk
+    fn get(&mut self, path: &PathBuf) -> Option<&str> {
+        let key = file_stamp(path);
+        if key.is_none() || key != self.key {
+            self.content = key.and_then(|_| std::fs::read_to_string(path).ok());
+            self.key = if self.content.is_some() { key } else { None };
+        }
+        self.content.as_deref()
+    }
+}
+
 /// Application state
 struct App {
     pty_state: Arc<Mutex<PtyState>>,
@@ -445,8 +507,16 @@ struct App {
     mode: Mode,
     task_dir: PathBuf,
     prd_path: PathBuf,
+    // Paths read by the Progress/Requirements views, joined once at startup
+    progress_path: PathBuf,
+    prd_md_path: PathBuf,
+    progress_file: CachedFile,
+    prd_md_file: CachedFile,
     prd: Option<Prd>,
-    prd_needs_reload: Arc<Mutex<bool>>,
+    /// Modification time and size of prd.json when it was last loaded on the restart path
+    prd_stamp: Option<(SystemTime, u64)>,
+    /// Freshly parsed PRD delivered by the file watcher thread
+    pending_prd: Arc<Mutex<Option<Prd>>>,
     // Iteration loop state
     current_iteration: u32,
     max_iterations: u32,
@@ -482,6 +552,9 @@ struct App {
 impl App {
     fn new(rows: u16, cols: u16, config: CliConfig) -> Self {
         let prd_path = config.task_dir.join("prd.json");
+        let progress_path = config.task_dir.join("progress.txt");
+        let prd_md_path = config.task_dir.join("prd.md");
+        let prd_stamp = file_stamp(&prd_path);
         let prd = Prd::load(&prd_path).ok();
         let now = Instant::now();
         // Generate session ID from process ID (format: RL-XXXXX)
@@ -496,8 +569,13 @@ impl App {
             mode: Mode::Ralph, // Default to Ralph mode
             task_dir: config.task_dir,
             prd_path,
+            progress_path,
+            prd_md_path,
+            progress_file: CachedFile::default(),
+            prd_md_file: CachedFile::default(),
             prd,
-            prd_needs_reload: Arc::new(Mutex::new(false)),
+            prd_stamp,
+            pending_prd: Arc::new(Mutex::new(None)),
             current_iteration: 1,
             max_iterations: config.max_iterations,
             iteration_state: IterationState::Running,
@@ -530,24 +608,18 @@ impl App {
         }
     }
 
-    /// Reload PRD from disk if flagged
+    /// Swap in the PRD parsed by the watcher thread, if a new one is available
+    /// (disk I/O and JSON parsing happen off the UI thread)
     fn reload_prd_if_needed(&mut self) {
-        let needs_reload = {
-            let Ok(mut flag) = self.prd_needs_reload.lock() else {
+        let pending = {
+            let Ok(mut pending) = self.pending_prd.lock() else {
                 return;
             };
-            if *flag {
-                *flag = false;
-                true
-            } else {
-                false
-            }
+            pending.take()
         };
 
-        if needs_reload {
-            if let Ok(prd) = Prd::load(&self.prd_path) {
-                self.prd = Some(prd);
-            }
+        if let Some(prd) = pending {
+            self.prd = Some(prd);
         }
     }
 
@@ -889,31 +961,38 @@ fn render_progress_cards(
 /// Embedded default prompt.md as fallback
 const EMBEDDED_PROMPT: &str = include_str!("../../prompt.md");
 
+/// Global config directory: ~/.config/ralph (Unix) or %USERPROFILE%\.config\ralph (Windows)
+/// Resolved once and reused by the prompt and settings lookups on every iteration
+fn ralph_config_dir() -> Option<&'static PathBuf> {
+    static CONFIG_DIR: OnceLock<Option<PathBuf>> = OnceLock::new();
+    CONFIG_DIR
+        .get_or_init(|| {
+            let home_dir = if cfg!(windows) {
+                std::env::var_os("USERPROFILE")
+            } else {
+                std::env::var_os("HOME")
+            };
+            home_dir.map(|home| PathBuf::from(home).join(".config").join("ralph"))
+        })
+        .as_ref()
+}
+
 /// Find prompt.md in order of priority:
 /// 1. ./ralph/prompt.md (local project customization)
 /// 2. ~/.config/ralph/prompt.md (global user config)
 /// 3. Embedded fallback (with warning)
 fn find_prompt_content() -> (String, Option<String>) {
-    // 1. Check local ./ralph/prompt.md
+    // 1. Check local ./ralph/prompt.md (a missing file just fails the read, no exists() probe needed)
     let local_path = PathBuf::from("ralph/prompt.md");
-    if local_path.exists() {
-        if let Ok(content) = std::fs::read_to_string(&local_path) {
-            return (content, Some(local_path.display().to_string()));
-        }
+    if let Ok(content) = std::fs::read_to_string(&local_path) {
+        return (content, Some(local_path.display().to_string()));
     }
 
     // 2. Check global ~/.config/ralph/prompt.md (Unix) or %USERPROFILE%\.config\ralph\prompt.md (Windows)
-    let home_dir = if cfg!(windows) {
-        std::env::var_os("USERPROFILE")
-    } else {
-        std::env::var_os("HOME")
-    };
-    if let Some(home) = home_dir {
-        let global_path = PathBuf::from(home).join(".config").join("ralph").join("prompt.md");
-        if global_path.exists() {
-            if let Ok(content) = std::fs::read_to_string(&global_path) {
-                return (content, Some(global_path.display().to_string()));
-            }
+    if let Some(config_dir) = ralph_config_dir() {
+        let global_path = config_dir.join("prompt.md");
+        if let Ok(content) = std::fs::read_to_string(&global_path) {
+            return (content, Some(global_path.display().to_string()));
         }
     }
 
@@ -956,7 +1035,8 @@ fn render_vt100_screen(screen: &vt100::Screen) -> Vec<Line<'static>> {
 
     // Render each visible row
     for row in 0..rows {
-        let mut spans = Vec::new();
+        // At most one span per column, so reserve up front to avoid regrowth
+        let mut spans = Vec::with_capacity(cols as usize);
         let mut col = 0u16;
 
         while col < cols {
@@ -1430,7 +1510,7 @@ fn parse_args() -> io::Result<CliConfig> {
 
     // Check progress file for rotation threshold prompt
     let progress_path = task_dir.join("progress.txt");
-    if progress_path.exists() && !skip_prompts {
+    if !skip_prompts {
         if let Ok(content) = std::fs::read_to_string(&progress_path) {
             let lines = content.lines().count();
             // Prompt if within 50 lines of threshold or has prior rotations
@@ -1460,14 +1540,6 @@ fn spawn_claude(
     // Build the Ralph prompt
     let ralph_prompt = build_ralph_prompt(&app.task_dir)?;
 
-    // Write prompt to a temp file for safe handling of special characters
-    let prompt_temp_file = std::env::temp_dir().join(format!(
-        "ralph_prompt_{}_{}.txt",
-        std::process::id(),
-        app.current_iteration
-    ));
-    std::fs::write(&prompt_temp_file, &ralph_prompt)?;
-
     // Create PTY
     let pty_system = native_pty_system();
     let pair = pty_system
@@ -1501,13 +1573,8 @@ fn spawn_claude(
     // Use ralph settings file for stop hook (enables iteration detection)
     // Settings are installed to ~/.config/ralph/settings.json by install.sh (Unix)
     // or %USERPROFILE%\.config\ralph\settings.json by install.ps1 (Windows)
-    let home_dir = if cfg!(windows) {
-        std::env::var_os("USERPROFILE")
-    } else {
-        std::env::var_os("HOME")
-    };
-    if let Some(home) = home_dir {
-        let settings_path = PathBuf::from(home).join(".config").join("ralph").join("settings.json");
+    if let Some(config_dir) = ralph_config_dir() {
+        let settings_path = config_dir.join("settings.json");
         if settings_path.exists() {
             cmd.arg("--settings");
             cmd.arg(settings_path.to_string_lossy().to_string());
@@ -1515,11 +1582,8 @@ fn spawn_claude(
     }
 
     // Prompt is passed as the last positional argument
-    let prompt_content = std::fs::read_to_string(&prompt_temp_file)?;
-    cmd.arg(&prompt_content);
-
-    // Clean up temp file
-    let _ = std::fs::remove_file(&prompt_temp_file);
+    // (argv goes straight to exec without a shell, so special characters need no escaping)
+    cmd.arg(&ralph_prompt);
 
     let child = pair
         .slave
@@ -1652,9 +1716,9 @@ fn main() -> io::Result<()> {
     let mut app = App::new(pty_rows, pty_cols, config);
 
     // Set up file watcher for prd.json
-    let prd_needs_reload = Arc::clone(&app.prd_needs_reload);
+    let pending_prd = Arc::clone(&app.pending_prd);
     let prd_path_for_watcher = app.prd_path.clone();
-    let _watcher = setup_prd_watcher(prd_path_for_watcher, prd_needs_reload);
+    let _watcher = setup_prd_watcher(prd_path_for_watcher, pending_prd);
 
     // Track last known size for resize detection
     let mut last_cols = pty_cols;
@@ -1668,9 +1732,13 @@ fn main() -> io::Result<()> {
         // Run the UI loop for current iteration
         let run_result = run(&mut terminal, &mut app, &mut last_cols, &mut last_rows);
 
-        // Clean up current iteration - kill the child process first to avoid blocking
-        let _ = child.kill();
-        let _ = child.wait();
+        // Clean up current iteration - kill the child process first to avoid blocking.
+        // Claude normally keeps running after the stop hook, so this is the usual path;
+        // try_wait only skips the kill if it already exited on its own (quit or crash)
+        if !matches!(child.try_wait(), Ok(Some(_))) {
+            let _ = child.kill();
+            let _ = child.wait();
+        }
         drop(app.master_pty.take());
         drop(app.pty_writer.take());
         let _ = reader_thread.join();
@@ -1707,15 +1775,19 @@ fn main() -> io::Result<()> {
                 app.iteration_start = Instant::now();
                 app.delay_start = None;
 
-                // Reload PRD to get latest state
-                if let Ok(prd) = Prd::load(&app.prd_path) {
-                    // Check if all stories pass - project is complete!
-                    if prd.all_stories_pass() {
+                // Reload PRD to get latest state (skip the re-parse if the file is unchanged)
+                let prd_stamp = file_stamp(&app.prd_path);
+                if prd_stamp.is_none() || prd_stamp != app.prd_stamp {
+                    if let Ok(prd) = Prd::load(&app.prd_path) {
                         app.prd = Some(prd);
-                        app.iteration_state = IterationState::Completed;
-                        break Ok(());
+                        app.prd_stamp = prd_stamp;
                     }
-                    app.prd = Some(prd);
+                }
+
+                // Check if all stories pass - project is complete!
+                if app.prd.as_ref().map_or(false, |prd| prd.all_stories_pass()) {
+                    app.iteration_state = IterationState::Completed;
+                    break Ok(());
                 }
 
                 // Spawn new Claude process
@@ -1745,9 +1817,10 @@ fn main() -> io::Result<()> {
 }
 
 /// Set up a file watcher for prd.json changes
+/// The PRD is re-parsed on the watcher thread and handed to the UI via `pending_prd`
 fn setup_prd_watcher(
     prd_path: PathBuf,
-    needs_reload: Arc<Mutex<bool>>,
+    pending_prd: Arc<Mutex<Option<Prd>>>,
 ) -> Option<RecommendedWatcher> {
     // Use a shorter poll interval for more responsive updates
     let config = Config::default().with_poll_interval(Duration::from_millis(500));
@@ -1755,6 +1828,7 @@ fn setup_prd_watcher(
     // Canonicalize the path for reliable comparison
     let canonical_prd = prd_path.canonicalize().unwrap_or_else(|_| prd_path.clone());
     let prd_filename = prd_path.file_name().map(|s| s.to_os_string());
+    let load_path = prd_path.clone();
 
     let watcher_result = RecommendedWatcher::new(
         move |res: Result<notify::Event, notify::Error>| {
@@ -1778,8 +1852,11 @@ fn setup_prd_watcher(
                 });
 
                 if matches {
-                    if let Ok(mut flag) = needs_reload.lock() {
-                        *flag = true;
+                    // Parse here so the UI thread never blocks on disk I/O
+                    if let Ok(prd) = Prd::load(&load_path) {
+                        if let Ok(mut pending) = pending_prd.lock() {
+                            *pending = Some(prd);
+                        }
                     }
                 }
             }
@@ -2128,8 +2205,11 @@ fn run(
 
             // Render story cards if we have a PRD
             if let Some(ref prd) = app.prd {
+                // Find current story once; used for the progress bar and card state
+                let current_story = prd.current_story();
+
                 // Calculate progress percent for active story based on per-criteria completion
-                let progress_percent = if let Some(story) = prd.current_story() {
+                let progress_percent = if let Some(story) = current_story {
                     let total = story.acceptance_criteria.len();
                     if total > 0 {
                         let passed = story.acceptance_criteria.iter().filter(|c| c.passes).count();
@@ -2145,9 +2225,6 @@ fn run(
                 let mut stories: Vec<_> = prd.user_stories.iter().collect();
                 stories.sort_by_key(|s| s.priority);
 
-                // Find current story for state comparison
-                let current_story = prd.current_story();
-
                 // Card heights: active = 5 lines, others = 3 lines
                 let active_card_height = 5u16;
                 let normal_card_height = 3u16;
@@ -2445,8 +2522,7 @@ fn run(
                         let mut stories: Vec<_> = prd.user_stories.iter().collect();
                         stories.sort_by_key(|s| s.priority);
                         if let Some(story) = stories.get(app.selected_story_index) {
-                            let progress_path = app.task_dir.join("progress.txt");
-                            if let Ok(content) = std::fs::read_to_string(&progress_path) {
+                            if let Some(content) = app.progress_file.get(&app.progress_path) {
                                 // Find entries containing the story ID
                                 let story_id = &story.id;
                                 let mut matching_lines: Vec<Line> = vec![
@@ -2460,11 +2536,13 @@ fn run(
                                 let mut in_matching_section = false;
                                 let mut found_any = false;
                                 for line in content.lines() {
-                                    if line.contains(story_id) && line.starts_with("##") {
+                                    // Cheap prefix test first; only headers are searched for the ID
+                                    let is_header = line.starts_with("##");
+                                    if is_header && line.contains(story_id) {
                                         in_matching_section = true;
                                         found_any = true;
                                         continue; // Skip the header line itself
-                                    } else if line.starts_with("##") || line.starts_with("---") {
+                                    } else if is_header || line.starts_with("---") {
                                         in_matching_section = false;
                                     }
 
@@ -2500,8 +2578,7 @@ fn run(
                         let mut stories: Vec<_> = prd.user_stories.iter().collect();
                         stories.sort_by_key(|s| s.priority);
                         if let Some(story) = stories.get(app.selected_story_index) {
-                            let prd_md_path = app.task_dir.join("prd.md");
-                            if let Ok(content) = std::fs::read_to_string(&prd_md_path) {
+                            if let Some(content) = app.prd_md_file.get(&app.prd_md_path) {
                                 let story_id = &story.id;
                                 let story_title = &story.title;
                                 let mut matching_lines: Vec<Line> = vec![
@@ -2516,13 +2593,14 @@ fn run(
                                 let mut found_any = false;
                                 for line in content.lines() {
                                     // Look for headers containing story ID or title
-                                    if (line.contains(story_id) || line.contains(story_title.as_str()))
-                                        && (line.starts_with("#") || line.starts_with("##"))
+                                    let is_header = line.starts_with('#');
+                                    if is_header
+                                        && (line.contains(story_id) || line.contains(story_title.as_str()))
                                     {
                                         in_matching_section = true;
                                         found_any = true;
                                         continue;
-                                    } else if line.starts_with("#") {
+                                    } else if is_header {
                                         in_matching_section = false;
                                     }
 
@@ -2608,14 +2686,20 @@ fn run(
 
         // Check if child exited or stop hook fired
         {
+            // Write debug info periodically (every ~5 seconds based on loop timing)
+            static DEBUG_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
+            let count = DEBUG_COUNTER.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+
             let state_result = app.pty_state.lock();
             let (child_exited, is_complete, stop_hook_fired, debug_info) = match state_result {
                 Ok(mut state) => {
                     // Update activities one final time before checking exit
                     state.update_activities();
                     let stop_signal = state.has_stop_hook_signal();
-                    // Debug: capture last 500 chars of recent_output for logging
-                    let debug = if stop_signal {
+                    // Debug: only build the log message on frames where it gets written
+                    let debug = if count % 100 != 0 && !stop_signal {
+                        String::new()
+                    } else if stop_signal {
                         format!("STOP HOOK DETECTED! Buffer len: {}", state.recent_output.len())
                     } else {
                         let stripped = strip_ansi_codes(&state.recent_output);
@@ -2632,9 +2716,6 @@ fn run(
                 Err(_) => (true, false, false, "Mutex poisoned".to_string()),
             };
 
-            // Write debug info periodically (every ~5 seconds based on loop timing)
-            static DEBUG_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
-            let count = DEBUG_COUNTER.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
             if count % 100 == 0 || stop_hook_fired {
                 let debug_log_path = std::env::temp_dir().join("ralph-tui-debug.log");
                 let _ = std::fs::write(debug_log_path, format!(
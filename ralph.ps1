@@ -210,26 +210,23 @@ function Rotate-ProgressIfNeeded {
 
         # Extract patterns section
         $patternsSection = ""
-        if ($rotatedContent -match "## Codebase Patterns") {
-            $matches = [regex]::Match($rotatedContent, "(## Codebase Patterns.*?)(?=## [^C]|$)", [System.Text.RegularExpressions.RegexOptions]::Singleline)
-            if ($matches.Success) {
-                $patternsSection = $matches.Groups[1].Value.TrimEnd()
-            }
+        $matches = [regex]::Match($rotatedContent, "(## Codebase Patterns.*?)(?=## [^C]|$)", [System.Text.RegularExpressions.RegexOptions]::Singleline)
+        if ($matches.Success) {
+            $patternsSection = $matches.Groups[1].Value.TrimEnd()
         }
 
-        # Get effort info from rotated file
+        # Get effort info and count stories completed in one pass over the content already read
         $effortName = ""
         $effortType = ""
         $started = ""
-        foreach ($line in (Get-Content $rotatedFile)) {
+        $storyCount = 0
+        foreach ($line in ($rotatedContent -split "\r?\n")) {
             if ($line -match "^Effort:") { $effortName = $line }
-            if ($line -match "^Type:") { $effortType = $line }
-            if ($line -match "^Started:") { $started = $line }
+            elseif ($line -match "^Type:") { $effortType = $line }
+            elseif ($line -match "^Started:") { $started = $line }
+            elseif ($line -match "^## .* - S\d+") { $storyCount++ }
         }
 
-        # Count stories completed
-        $storyCount = (Select-String -Path $rotatedFile -Pattern "^## .* - S\d+" -AllMatches).Matches.Count
-
         # Build prior reference
         $priorRef = ""
         if ($n -gt 1) {
@@ -286,9 +283,11 @@ for ($i = 1; $i -le $Iterations; $i++) {
     # Check and rotate progress file if needed
     Rotate-ProgressIfNeeded
 
-    # Refresh progress count
-    $prd = Get-Content $PrdFile -Raw | ConvertFrom-Json
-    $CompletedStories = if ($prd.userStories) { ($prd.userStories | Where-Object { $_.passes -eq $true }).Count } else { "?" }
+    # Refresh progress count (the banner already read it for the first iteration)
+    if ($i -gt 1) {
+        $prd = Get-Content $PrdFile -Raw | ConvertFrom-Json
+        $CompletedStories = if ($prd.userStories) { ($prd.userStories | Where-Object { $_.passes -eq $true }).Count } else { "?" }
+    }
 
     Write-Host ""
     Write-Host ("=" * 67)
@@ -310,8 +309,8 @@ $promptContent
     # Create temp file for output
     $outputFile = [System.IO.Path]::GetTempFileName()
 
-    # Start time tracking
-    $startTime = Get-Date
+    # Start time tracking (Stopwatch is monotonic, unaffected by clock changes)
+    $stopwatch = [System.Diagnostics.Stopwatch]::StartNew()
     $lastStatus = "Starting..."
 
     Write-Host ""
@@ -326,7 +325,7 @@ $promptContent
     # Show spinner while claude runs
     $spinnerIndex = 0
     while ($job.State -eq "Running") {
-        $elapsed = (Get-Date) - $startTime
+        $elapsed = $stopwatch.Elapsed
         $mins = [Math]::Floor($elapsed.TotalMinutes)
         $secs = $elapsed.Seconds
 
@@ -369,7 +368,7 @@ $promptContent
     Remove-Job $job
 
     # Show completion
-    $elapsed = (Get-Date) - $startTime
+    $elapsed = $stopwatch.Elapsed
     $mins = [Math]::Floor($elapsed.TotalMinutes)
     $secs = $elapsed.Seconds
     $timeStr = "{0:D2}:{1:D2}" -f $mins, $secs
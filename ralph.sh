@@ -61,7 +61,7 @@ done
 find_active_tasks() {
   find tasks -maxdepth 2 -name "prd.json" -type f 2>/dev/null | \
     grep -v "tasks/archived/" | \
-    xargs -I {} dirname {} | \
+    sed 's|/prd\.json$||' | \
     sort
 }
 
@@ -69,11 +69,14 @@ find_active_tasks() {
 display_task_info() {
   local task_dir="$1"
   local prd_file="$task_dir/prd.json"
-  local description=$(jq -r '.description // "No description"' "$prd_file" 2>/dev/null | head -c 60)
-  local total=$(jq '.userStories | length' "$prd_file" 2>/dev/null || echo "?")
-  local done=$(jq '[.userStories[] | select(.passes == true)] | length' "$prd_file" 2>/dev/null || echo "?")
-  local type=$(jq -r '.type // "feature"' "$prd_file" 2>/dev/null)
-  printf "%-35s [%s/%s] %s\n" "$task_dir" "$done" "$total" "($type)"
+  local done total type
+  # Single jq call for both story counts and the type
+  # (|| true: an unreadable prd.json must not end the picker under set -e)
+  read -r done total type < <(
+    jq -r '[([(.userStories // [])[] | select(.passes == true)] | length),
+            ((.userStories // []) | length), (.type // "feature")] | map(tostring) | join(" ")' "$prd_file" 2>/dev/null
+  ) || true
+  printf "%-35s [%s/%s] %s\n" "$task_dir" "${done:-?}" "${total:-?}" "(${type:-feature})"
 }
 
 # If no task directory provided, find and prompt
@@ -150,6 +153,9 @@ PRD_FILE="$FULL_TASK_DIR/prd.json"
 PROGRESS_FILE="$FULL_TASK_DIR/progress.txt"
 PROMPT_FILE="$SCRIPT_DIR/prompt.md"
 
+# Completed-story count, shared by the banner and every later refresh so they always agree
+COMPLETED_FILTER='[(.userStories // [])[] | select(.passes == true)] | length'
+
 # Validate task directory exists
 if [ ! -d "$FULL_TASK_DIR" ]; then
   echo "Error: Task directory not found: $TASK_DIR"
@@ -165,13 +171,18 @@ fi
 
 # Initialize progress file if it doesn't exist
 if [ ! -f "$PROGRESS_FILE" ]; then
-  EFFORT_NAME=$(basename "$TASK_DIR")
+  # Strip every trailing slash (like basename) before taking the last path component
+  EFFORT_NAME="$TASK_DIR"
+  while [[ "$EFFORT_NAME" == */ ]]; do EFFORT_NAME="${EFFORT_NAME%/}"; done
+  EFFORT_NAME="${EFFORT_NAME##*/}"
   PRD_TYPE=$(jq -r '.type // "feature"' "$PRD_FILE" 2>/dev/null || echo "feature")
-  echo "# Ralph Progress Log" > "$PROGRESS_FILE"
-  echo "Effort: $EFFORT_NAME" >> "$PROGRESS_FILE"
-  echo "Type: $PRD_TYPE" >> "$PROGRESS_FILE"
-  echo "Started: $(date)" >> "$PROGRESS_FILE"
-  echo "---" >> "$PROGRESS_FILE"
+  {
+    echo "# Ralph Progress Log"
+    echo "Effort: $EFFORT_NAME"
+    echo "Type: $PRD_TYPE"
+    echo "Started: $(date)"
+    echo "---"
+  } > "$PROGRESS_FILE"
 fi
 
 # Function to rotate progress file if needed
@@ -208,19 +219,20 @@ rotate_progress_if_needed() {
     # Move current to progress-N.txt
     mv "$PROGRESS_FILE" "$TASK_DIR/progress-$n.txt"
 
-    # Extract codebase patterns section
-    local patterns_section=""
-    if grep -q "## Codebase Patterns" "$TASK_DIR/progress-$n.txt"; then
-      patterns_section=$(sed -n '/## Codebase Patterns/,/^## [^C]/p' "$TASK_DIR/progress-$n.txt" | sed '$d')
-    fi
-
-    # Get effort info from rotated file
-    local effort_name=$(grep "^Effort:" "$TASK_DIR/progress-$n.txt" | head -1)
-    local effort_type=$(grep "^Type:" "$TASK_DIR/progress-$n.txt" | head -1)
-    local started=$(grep "^Started:" "$TASK_DIR/progress-$n.txt" | head -1)
-
-    # Count stories completed in rotated file
-    local story_count=$(grep -c "^## .* - S[0-9]" "$TASK_DIR/progress-$n.txt" 2>/dev/null || echo "0")
+    # Extract codebase patterns section (empty when the file has none)
+    local patterns_section
+    patterns_section=$(sed -n '/## Codebase Patterns/,/^## [^C]/p' "$TASK_DIR/progress-$n.txt" | sed '$d')
+
+    # Get effort info and count stories completed in one pass over the rotated file
+    local effort_name effort_type started story_count
+    IFS=$'\x1f' read -r effort_name effort_type started story_count < <(
+      awk '/^Effort:/ && e == "" { e = $0 }
+           /^Type:/ && t == "" { t = $0 }
+           /^Started:/ && s == "" { s = $0 }
+           /^## .* - S[0-9]/ { c++ }
+           END { printf "%s\037%s\037%s\037%d\n", e, t, s, c }' "$TASK_DIR/progress-$n.txt" 2>/dev/null
+    ) || true
+    story_count="${story_count:-0}"
 
     # Build reference chain
     local prior_ref=""
@@ -250,11 +262,19 @@ EOF
   fi
 }
 
-# Get info from prd.json for display
-DESCRIPTION=$(jq -r '.description // "No description"' "$PRD_FILE" 2>/dev/null || echo "Unknown")
-BRANCH_NAME=$(jq -r '.branchName // "unknown"' "$PRD_FILE" 2>/dev/null || echo "unknown")
-TOTAL_STORIES=$(jq '.userStories | length' "$PRD_FILE" 2>/dev/null || echo "?")
-COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+# Get info from prd.json for display in one jq pass. Fields are separated by \x1f and the
+# description goes last, so read -d '' keeps any newlines in it; the fallbacks only apply
+# when jq itself fails, as they did for the separate per-field calls.
+if PRD_SUMMARY=$(jq -j '[.branchName // "unknown", (.userStories | length),
+                         ('"$COMPLETED_FILTER"'),
+                         .description // "No description"] | map(tostring) | join("\u001f")' "$PRD_FILE" 2>/dev/null); then
+  IFS=$'\x1f' read -r -d '' BRANCH_NAME TOTAL_STORIES COMPLETED_STORIES DESCRIPTION < <(printf '%s' "$PRD_SUMMARY") || true
+else
+  DESCRIPTION="Unknown"
+  BRANCH_NAME="unknown"
+  TOTAL_STORIES="?"
+  COMPLETED_STORIES="?"
+fi
 
 echo ""
 echo "╔═══════════════════════════════════════════════════════════════╗"
@@ -273,8 +293,10 @@ for i in $(seq 1 $MAX_ITERATIONS); do
   # Check and rotate progress file if needed
   rotate_progress_if_needed
 
-  # Refresh progress count
-  COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+  # Refresh progress count (the banner already read it for the first iteration)
+  if [ $i -gt 1 ]; then
+    COMPLETED_STORIES=$(jq "$COMPLETED_FILTER" "$PRD_FILE" 2>/dev/null || echo "?")
+  fi
 
   echo ""
   echo "═══════════════════════════════════════════════════════════════"
@@ -302,7 +324,8 @@ $(cat "$PROMPT_FILE")
 
   # Show spinner while claude runs
   SPINNER="⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-  START_TIME=$(date +%s)
+  # Built-in $SECONDS avoids forking date each tick (it follows the wall clock, so it is not monotonic)
+  START_TIME=$SECONDS
   LAST_STATUS="Starting..."
 
   # Print initial lines (spinner + status)
@@ -310,7 +333,7 @@ $(cat "$PROMPT_FILE")
   echo ""
 
   while kill -0 $CLAUDE_PID 2>/dev/null; do
-    ELAPSED=$(($(date +%s) - START_TIME))
+    ELAPSED=$((SECONDS - START_TIME))
     MINS=$((ELAPSED / 60))
     SECS=$((ELAPSED % 60))
 
@@ -333,10 +356,9 @@ $(cat "$PROMPT_FILE")
       if ! kill -0 $CLAUDE_PID 2>/dev/null; then
         break 2
       fi
-      # Move up 2 lines, clear and print spinner, then status
-      printf "\033[2A"
-      printf "\r\033[K  ${SPINNER:$j:1} Claude working... %02d:%02d\n" $MINS $SECS
-      printf "\033[K  \033[90m%.70s\033[0m\n" "$LAST_STATUS"
+      # Move up 2 lines, clear and print spinner, then status (one write per frame)
+      printf "\033[2A\r\033[K  ${SPINNER:$j:1} Claude working... %02d:%02d\n\033[K  \033[90m%.70s\033[0m\n" \
+        $MINS $SECS "$LAST_STATUS"
       sleep 0.1
     done
   done
@@ -345,7 +367,7 @@ $(cat "$PROMPT_FILE")
   wait $CLAUDE_PID || true
 
   # Clear spinner line and show completion
-  ELAPSED=$(($(date +%s) - START_TIME))
+  ELAPSED=$((SECONDS - START_TIME))
   MINS=$((ELAPSED / 60))
   SECS=$((ELAPSED % 60))
   printf "\033[2A"
@@ -394,7 +416,7 @@ echo "╔═══════════════════════
 echo "║  Ralph reached max iterations                                 ║"
 echo "╚═══════════════════════════════════════════════════════════════╝"
 echo ""
-COMPLETED_STORIES=$(jq '[.userStories[] | select(.passes == true)] | length' "$PRD_FILE" 2>/dev/null || echo "?")
+COMPLETED_STORIES=$(jq "$COMPLETED_FILTER" "$PRD_FILE" 2>/dev/null || echo "?")
 echo "  Completed $COMPLETED_STORIES of $TOTAL_STORIES stories in $MAX_ITERATIONS iterations."
 echo "  Check $PROGRESS_FILE for status."
 echo "  Run again with more iterations: ./ralph.sh $TASK_DIR <more_iterations>"